@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import json
 import os
-import re
 from dataclasses import asdict
 from datetime import datetime
 
@@ -15,8 +14,18 @@ from soc_platform.ai.providers import MODEL_REGISTRY, create_provider, model_cho
 from soc_platform.ai.providers.base import AIProviderError
 from soc_platform.config import load_config
 from soc_platform.engines.intelligence import build_intelligence_package, package_to_stix_like
-from soc_platform.engines.hunting import build_spectra_report, export_spectra_json, export_spectra_txt
-from soc_platform.engines.mitre import build_coverage, extract_techniques, weighted_coverage_score
+from soc_platform.engines.hunting import (
+    HUNT_TOOL_PLATFORMS,
+    build_spectra_report,
+    export_spectra_json,
+    export_spectra_txt,
+)
+from soc_platform.engines.mitre import (
+    TECHNIQUE_ID_RE,
+    build_coverage,
+    extract_techniques,
+    weighted_coverage_score,
+)
 from soc_platform.engines.playbook import build_detection_playbook, to_json, to_markdown
 from soc_platform.exports import (
     build_detection_engineering_report,
@@ -24,6 +33,7 @@ from soc_platform.exports import (
     build_json,
     build_professional_html_report,
     build_word_technical_guide,
+    report_timestamp,
 )
 from soc_platform.governance import (
     TokenMonitor,
@@ -86,6 +96,7 @@ SESSION_DEFAULTS = {
     "pipeline_queue": 0,
     "active_phase": 1,
     "recent_runs": [],
+    "ioc_total": 0,
     "saved_states": [],
     "hunt_history": [],
     "hunt_context": None,
@@ -102,6 +113,9 @@ SYSTEM_PROMPT = os.environ.get(
     "RF_SYSTEM_PROMPT",
     "You are a SOC analyst assistant. Produce concise, operationally actionable outputs.",
 )
+# Resolved once per session; module scope reruns on every interaction.
+if "principal" not in st.session_state:
+    st.session_state["principal"] = os.environ.get("RF_PRINCIPAL", "local-user")
 
 inject_theme(st.session_state["theme"])
 selected_page = sidebar_nav(config.app_name, PAGES, st.session_state["active_page"])
@@ -128,7 +142,7 @@ with st.sidebar:
         "Streaming",
         value=bool(st.session_state["model_streaming"]),
     )
-    st.metric("Token Usage", st.session_state["token_monitor"].get("local-user"))
+    st.metric("Token Usage", st.session_state["token_monitor"].get(st.session_state["principal"]))
     st.caption(
         f"Role `{config.user_role}` • High-cost models: "
         f"{'allowed' if policy.allow_high_cost_models else 'blocked'}"
@@ -153,7 +167,7 @@ if not config.has_llm_keys:
 
 
 def _run_ai_action(action: str, prompt: str):
-    principal = os.environ.get("RF_PRINCIPAL", "local-user")
+    principal = st.session_state["principal"]
     role = config.user_role
     model_key = st.session_state["model_choice"]
     if not can_use_model(role, model_key):
@@ -221,6 +235,8 @@ def _run_pipeline(input_text: str, input_kind: str, threat_name: str):
         "package": package,
     }
     st.session_state["recent_runs"] = ([run_record] + st.session_state["recent_runs"])[:10]
+    # Totalled over the retained runs here so the KPI strips need not re-sum per rerun.
+    st.session_state["ioc_total"] = sum(r["iocs"] for r in st.session_state["recent_runs"])
     st.session_state["detection_versions"].append(
         {
             "version": f"v{len(st.session_state['detection_versions']) + 1}",
@@ -237,6 +253,54 @@ def _status_color(value: bool) -> str:
     return "status-green" if value else "status-red"
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _coverage(techniques: tuple[str, ...]) -> list[dict]:
+    # st.cache_data hands back a copy per call, so callers may filter rows freely.
+    return build_coverage(list(techniques))
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _techniques(rule_text: str) -> list[str]:
+    return extract_techniques(rule_text)
+
+
+# NUL never survives json.dumps, so the slot cannot collide with payload text.
+_REPORT_STAMP_SLOT = "\x00generated_at\x00"
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _html_report_template(payload: dict, title: str) -> str:
+    # Keyed on the payload contents, so reruns with unchanged data skip the render.
+    # The stamp is left as a slot: the cache is shared across sessions and has no ttl.
+    return build_professional_html_report(payload, title, generated_at=_REPORT_STAMP_SLOT)
+
+
+def _html_report(payload: dict, title: str) -> str:
+    return _html_report_template(payload, title).replace(_REPORT_STAMP_SLOT, report_timestamp(), 1)
+
+
+def _export_payload(package, **technical_extra) -> dict:
+    # Shared by the Output Dock and the global export panel.
+    return {
+        "executive_summary": asdict(package.summary),
+        "technical_analysis": {
+            "behavior_patterns": package.behavior_patterns,
+            "attack_path": package.attack_path,
+            "campaign_context": package.campaign_context,
+            **technical_extra,
+        },
+        "ioc_tables": asdict(package.iocs),
+        "detection_queries": [asdict(q) for q in package.detection_queries],
+        "hunt_workflow": asdict(package.hunting_playbook),
+        "risk_and_recommendations": {
+            "risk_score": package.risk_score,
+            "confidence": package.summary.confidence,
+            "recommendations": package.hunting_playbook.containment,
+        },
+        "mitre_coverage_matrix": _coverage(tuple(package.summary.mitre_techniques)),
+    }
+
+
 if selected_page == "Home / Intelligence Hub":
     st.markdown("## SOC Intelligence Hub")
     st.caption("Command surface for intelligence, hunting, coverage, and operationalization.")
@@ -244,7 +308,7 @@ if selected_page == "Home / Intelligence Hub":
     k1, k2, k3, k4 = st.columns(4)
     k1.metric("Threats Analyzed", len(st.session_state["recent_runs"]))
     k2.metric("Rules Generated", len(st.session_state["detection_versions"]))
-    k3.metric("IOCs Collected", sum(r.get("iocs", 0) for r in st.session_state["recent_runs"]))
+    k3.metric("IOCs Collected", st.session_state["ioc_total"])
     k4.metric("Theme", st.session_state["theme"].title())
 
     c1, c2, c3 = st.columns(3)
@@ -372,7 +436,7 @@ if selected_page == "Threat Intelligence Engine":
 
             b1, b2, b3 = st.columns(3)
             b1.metric("Total Rules Generated", len(st.session_state["detection_versions"]))
-            b2.metric("Total IOCs Collected", sum(r.get("iocs", 0) for r in st.session_state["recent_runs"]))
+            b2.metric("Total IOCs Collected", st.session_state["ioc_total"])
             b3.metric("Threats Analyzed", len(st.session_state["recent_runs"]))
 
         else:
@@ -424,7 +488,7 @@ if selected_page == "Threat Intelligence Engine":
                 with feed_tabs[1]:
                     st.write("- " + "\n- ".join(package.behavior_patterns))
                 with feed_tabs[2]:
-                    st.dataframe(build_coverage(package.summary.mitre_techniques), use_container_width=True)
+                    st.dataframe(_coverage(tuple(package.summary.mitre_techniques)), use_container_width=True)
                 with feed_tabs[3]:
                     st.json(asdict(package.iocs), expanded=False)
                 with feed_tabs[4]:
@@ -445,13 +509,16 @@ if selected_page == "Threat Intelligence Engine":
                     st.write(" ".join([f"`{v}`" for v in values]))
 
             st.markdown("#### MITRE Mini-Map")
-            st.dataframe(build_coverage(package.summary.mitre_techniques), use_container_width=True)
+            st.dataframe(_coverage(tuple(package.summary.mitre_techniques)), use_container_width=True)
+
+            confidence_pct = int(package.summary.confidence * 100)
 
             with st.expander("Phase 2 – Detection Points", expanded=True):
                 ranked = package.detection_queries[:3]
                 for idx, q in enumerate(ranked, start=1):
                     st.markdown(f"**#{idx} {q.platform}**")
-                    st.progress(min(100, int(q.confidence * 100)), text=f"Reliability {int(q.confidence*100)}%")
+                    reliability = int(q.confidence * 100)
+                    st.progress(min(100, reliability), text=f"Reliability {reliability}%")
                     st.progress(min(100, int((q.confidence + 0.08) * 100)), text="Specificity")
                     st.progress(min(100, int((q.confidence + 0.05) * 100)), text="Evasion Resistance")
 
@@ -460,7 +527,7 @@ if selected_page == "Threat Intelligence Engine":
                 variant = st.radio("Variant", ["Primary", "Broad", "Correlation"], horizontal=True)
                 base_rule = package.detection_queries[0].query if package.detection_queries else "event.type == suspicious"
                 st.code(base_rule, language="yaml" if format_sel == "YAML" else "sql")
-                st.caption(f"Logic walkthrough: variant={variant}, source confidence={int(package.summary.confidence*100)}%")
+                st.caption(f"Logic walkthrough: variant={variant}, source confidence={confidence_pct}%")
                 st.button("Copy Rule")
 
             with st.expander("Phase 4 – Deployment Guides", expanded=True):
@@ -471,14 +538,16 @@ if selected_page == "Threat Intelligence Engine":
                     st.write("Validate impacted assets, pivot on related IOCs, isolate high-risk hosts.")
                 with d_tabs[2]:
                     st.write("Tune expected noise sources, suppress trusted infra, iterate on false positives.")
-                bundle_bytes = json.dumps(asdict(package), indent=2).encode("utf-8")
-                st.download_button("Download All (ZIP-like JSON bundle)", data=bundle_bytes, file_name="deployment_bundle.json")
+                # Serialising the whole package is the heaviest step on this page; only do it on request.
+                if st.toggle("Prepare deployment bundle", key="prepare_bundle"):
+                    bundle_bytes = json.dumps(asdict(package), indent=2).encode("utf-8")
+                    st.download_button("Download All (ZIP-like JSON bundle)", data=bundle_bytes, file_name="deployment_bundle.json")
 
             with st.expander("Phase 5 – Metrics & Scoring", expanded=True):
                 q1, q2 = st.columns(2)
                 q3, q4 = st.columns(2)
-                q1.metric("TP Rate", f"{int(package.summary.confidence*100)}%")
-                q2.metric("FP Risk", f"{max(1, 100 - int(package.summary.confidence*100))}%")
+                q1.metric("TP Rate", f"{confidence_pct}%")
+                q2.metric("FP Risk", f"{max(1, 100 - confidence_pct)}%")
                 q3.metric("Evasion Resistance", f"{int((package.summary.confidence + 0.06) * 100)}%")
                 grade = "A" if package.risk_score >= 8 else "B" if package.risk_score >= 6 else "C"
                 q4.metric("Target Grade", grade)
@@ -491,23 +560,7 @@ if selected_page == "Threat Intelligence Engine":
 
             st.markdown("---")
             st.markdown("### Output Dock")
-            payload = {
-                "executive_summary": asdict(package.summary),
-                "technical_analysis": {
-                    "behavior_patterns": package.behavior_patterns,
-                    "attack_path": package.attack_path,
-                    "campaign_context": package.campaign_context,
-                },
-                "ioc_tables": asdict(package.iocs),
-                "detection_queries": [asdict(q) for q in package.detection_queries],
-                "hunt_workflow": asdict(package.hunting_playbook),
-                "risk_and_recommendations": {
-                    "risk_score": package.risk_score,
-                    "confidence": package.summary.confidence,
-                    "recommendations": package.hunting_playbook.containment,
-                },
-                "mitre_coverage_matrix": build_coverage(package.summary.mitre_techniques),
-            }
+            payload = _export_payload(package)
             d1, d2, d3, d4, d5 = st.columns(5)
             d1.download_button("rule_primary.yml", data="rule: primary\n", file_name="rule_primary.yml")
             d2.download_button("triage_playbook.md", data=to_markdown(build_detection_playbook("Auto", package.summary.mitre_techniques, [], "")), file_name="triage_playbook.md")
@@ -536,6 +589,7 @@ if selected_page == "Threat Hunting Engine v2.0 (SPECTRA)":
     if not package:
         st.warning("No intelligence package found. Generate one in Threat Intelligence Engine first.")
     else:
+        report = build_spectra_report(package)
         z1, z2, z3 = st.columns([4, 3.5, 2.5])
         with z1:
             st.markdown("### INITIATE HUNT")
@@ -551,11 +605,11 @@ if selected_page == "Threat Hunting Engine v2.0 (SPECTRA)":
             c3.button("Load File", use_container_width=True)
             tool_toggles = st.multiselect(
                 "Tools",
-                ["SentinelOne", "Splunk", "Sentinel", "Palo Alto", "Okta", "DNS", "Proxy"],
+                list(HUNT_TOOL_PLATFORMS),
                 default=["SentinelOne", "Splunk", "Sentinel"],
             )
             if st.button("PREPARE HUNT", use_container_width=True, type="primary"):
-                score = build_spectra_report(package)["severity"]["score_0_10"]
+                score = report["severity"]["score_0_10"]
                 st.session_state["hunt_context"] = {
                     "id": f"H-{datetime.now().strftime('%H%M%S')}",
                     "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
@@ -572,7 +626,7 @@ if selected_page == "Threat Hunting Engine v2.0 (SPECTRA)":
                 sev_color = "🔴" if ctx["severity"] >= 8 else "🟠" if ctx["severity"] >= 6 else "🟡"
                 st.markdown(f"{sev_color} **Severity {ctx['severity']}/10**  •  `{ctx['id']}`  •  {ctx['timestamp']}")
                 st.markdown(f"**Hypothesis:** {ctx['hypothesis']}")
-                st.dataframe(build_coverage(package.summary.mitre_techniques), use_container_width=True)
+                st.dataframe(_coverage(tuple(package.summary.mitre_techniques)), use_container_width=True)
                 st.write("IOC Chips")
                 st.write(" ".join([f"`{x}`" for x in (package.iocs.ips + package.iocs.domains)[:12]]))
                 a1, a2, a3, a4 = st.columns(4)
@@ -595,18 +649,12 @@ if selected_page == "Threat Hunting Engine v2.0 (SPECTRA)":
         st.markdown("### Query Execution Surface")
         selected_tools = st.session_state.get("hunt_context", {}).get("tools", ["SentinelOne", "Splunk", "Sentinel"])
         query_tabs = st.tabs(selected_tools)
-        platform_map = {
-            "SentinelOne": "SentinelOne S1QL",
-            "Splunk": "Splunk SPL",
-            "Sentinel": "Microsoft Sentinel KQL",
-            "Palo Alto": "Palo Alto Query",
-            "Okta": "Okta Detection Query",
-            "DNS": "DNS Detection Logic",
-            "Proxy": "Proxy Search Logic",
-        }
+        queries_by_platform = {}
+        for q in package.detection_queries:
+            queries_by_platform.setdefault(q.platform, q)
         for tab, tool in zip(query_tabs, selected_tools):
             with tab:
-                qmatch = next((q for q in package.detection_queries if q.platform == platform_map.get(tool, "")), None)
+                qmatch = queries_by_platform.get(HUNT_TOOL_PLATFORMS.get(tool, ""))
                 if qmatch:
                     st.code(qmatch.query, language="sql")
                     st.caption(f"Why this query: {qmatch.tuning_guidance}")
@@ -623,14 +671,13 @@ if selected_page == "Threat Hunting Engine v2.0 (SPECTRA)":
                     st.info("Live analysis preview updated: risk and hit counts recalculated.")
 
         st.markdown("### Knowledge Report Surface")
-        report = build_spectra_report(package)
         k_tabs = st.tabs(["Summary", "Workflow", "MITRE", "Recommendations"])
         with k_tabs[0]:
             st.json(report["severity"], expanded=False)
         with k_tabs[1]:
             st.json(report["lifecycle"], expanded=False)
         with k_tabs[2]:
-            st.dataframe(build_coverage(package.summary.mitre_techniques), use_container_width=True)
+            st.dataframe(_coverage(tuple(package.summary.mitre_techniques)), use_container_width=True)
         with k_tabs[3]:
             for rec in package.hunting_playbook.containment:
                 st.checkbox(rec, value=False)
@@ -665,8 +712,8 @@ if selected_page == "MITRE ATT&CK Coverage Engine":
         ],
         default=[],
     )
-    techniques = extract_techniques(raw_rules)
-    coverage = build_coverage(techniques)
+    techniques = _techniques(raw_rules)
+    coverage = _coverage(tuple(techniques))
     if tactics:
         coverage = [r for r in coverage if r["tactic"] in tactics]
 
@@ -706,7 +753,7 @@ if selected_page == "Playbook Builder":
         )
         if playbook_error:
             st.warning(playbook_error)
-        techniques = [t.strip() for t in mitre_input.split(",") if re.match(r"^T\d{4}(?:\.\d{3})?$", t.strip())]
+        techniques = [t for t in (raw.strip() for raw in mitre_input.split(",")) if TECHNIQUE_ID_RE.fullmatch(t)]
         queries = [q.strip() for q in query_templates_raw.splitlines() if q.strip()]
         playbook = build_detection_playbook(scenario, techniques, queries, automation_logic)
         if playbook_ai:
@@ -722,7 +769,7 @@ if selected_page == "Playbook Builder":
         c2.download_button("Documentation", data=to_markdown(playbook), file_name="playbook_documentation.md")
         c3.download_button(
             "Bundle",
-            data=build_professional_html_report(
+            data=_html_report(
                 {
                     "executive_summary": playbook,
                     "technical_analysis": playbook,
@@ -740,25 +787,8 @@ if selected_page == "Playbook Builder":
 if st.session_state.get("intel_package") is not None:
     with st.expander("Global Export & Reporting", expanded=False):
         package = st.session_state["intel_package"]
-        payload = {
-            "executive_summary": asdict(package.summary),
-            "technical_analysis": {
-                "behavior_patterns": package.behavior_patterns,
-                "attack_path": package.attack_path,
-                "campaign_context": package.campaign_context,
-                "ai_report": st.session_state.get("last_report_ai", ""),
-            },
-            "ioc_tables": asdict(package.iocs),
-            "detection_queries": [asdict(q) for q in package.detection_queries],
-            "hunt_workflow": asdict(package.hunting_playbook),
-            "risk_and_recommendations": {
-                "risk_score": package.risk_score,
-                "confidence": package.summary.confidence,
-                "recommendations": package.hunting_playbook.containment,
-            },
-            "mitre_coverage_matrix": build_coverage(package.summary.mitre_techniques),
-        }
-        html_report = build_professional_html_report(payload, "RuleForge SOC Intelligence Report")
+        payload = _export_payload(package, ai_report=st.session_state.get("last_report_ai", ""))
+        html_report = _html_report(payload, "RuleForge SOC Intelligence Report")
         y1, y2, y3, y4, y5, y6, y7 = st.columns(7)
         y1.download_button("PDF Report", data=html_report, file_name="soc_report.html")
         y2.download_button("Executive", data=build_executive_summary(payload), file_name="executive_summary.txt")
@@ -14,6 +14,11 @@ import sys
 from datetime import date
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional parse speedup
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).parent.parent
 DEFAULT_SOURCE = PROJECT_ROOT / "vendor_kb_combined.json"
 OUTPUT_DIR = PROJECT_ROOT / "knowledge_bases"
@@ -35,21 +40,34 @@ PLATFORM_NAMES = {
     "sentinelone": "SentinelOne",
 }
 
+# Doubled opening quote seen on some "field" values in the combined export.
+FIELD_DOUBLEQUOTE_RE = re.compile(r'"field":\s*""([^"]+)"')
+
 def fix_json(raw: str) -> str:
     raw = raw.replace('\u201c', '"').replace('\u201d', '"')
     raw = raw.replace('\u2018', "'").replace('\u2019', "'")
-    raw = re.sub(r'"field":\s*""([^"]+)"', r'"field": "\1"', raw)
+    raw = FIELD_DOUBLEQUOTE_RE.sub(r'"field": "\1"', raw)
     return raw
 
+def json_loads(raw: str | bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def load_combined(path: Path) -> dict:
     print(f"Loading: {path}")
     with open(path, "rb") as f:
-        raw = f.read().decode("utf-8", errors="replace")
+        raw = f.read()
+    try:
+        # Both parsers take UTF-8 bytes directly; only decode when that fails.
+        return json_loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        text = raw.decode("utf-8", errors="replace")
     try:
-        return json.loads(raw)
+        return json_loads(text)
     except json.JSONDecodeError:
         print("  Applying JSON repairs...")
-        return json.loads(fix_json(raw))
+        return json_loads(fix_json(text))
 
 def main():
     ap = argparse.ArgumentParser()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from soc_platform.ai.providers.anthropic_provider import AnthropicProvider
 from soc_platform.ai.providers.base import BaseAIProvider
@@ -17,14 +18,16 @@ class ModelChoice:
     high_cost: bool
 
 
-MODEL_REGISTRY = {
+MODEL_REGISTRY = MappingProxyType({
     "openai:gpt-4o": ModelChoice("OpenAI GPT-4o", "openai", "gpt-4o", True),
     "anthropic:claude-3-5-sonnet": ModelChoice(
         "Anthropic Claude 3.5 Sonnet", "anthropic", "claude-3-5-sonnet", True
     ),
     "google:gemini-1.5-pro": ModelChoice("Google Gemini", "google", "gemini-1.5-pro", False),
     "local:deterministic": ModelChoice("Local Deterministic", "local", "deterministic", False),
-}
+})
+
+_MODEL_KEYS = tuple(MODEL_REGISTRY)
 
 
 PROVIDER_CLASSES = {
@@ -53,5 +56,5 @@ def create_provider(
     )
 
 
-def model_choices() -> list[str]:
-    return list(MODEL_REGISTRY.keys())
+def model_choices() -> tuple[str, ...]:
+    return _MODEL_KEYS
@@ -4,7 +4,7 @@ import os
 import time
 
 from soc_platform.ai.providers.base import AIProviderError, AIResult, BaseAIProvider
-from soc_platform.ai.providers.sdk_utils import guard, log_usage, with_retry
+from soc_platform.ai.providers.sdk_utils import cached_client, guard, log_usage, with_retry
 
 
 class OpenAIProvider(BaseAIProvider):
@@ -24,7 +24,7 @@ class OpenAIProvider(BaseAIProvider):
                 provider=self.provider_name,
                 model=self.model,
             ) from exc
-        return OpenAI(api_key=self.api_key)
+        return cached_client(OpenAI, self.api_key)
 
     def _invoke(self, action: str, prompt: str) -> AIResult:
         def _call():
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 import logging
 import time
 from collections.abc import Callable
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from soc_platform.ai.providers.base import AIProviderError
 
@@ -42,3 +43,9 @@ def log_usage(provider: str, model: str, action: str, tokens: int, latency_ms: i
 def guard(condition: bool, message: str, provider: str, model: str) -> None:
     if not condition:
         raise AIProviderError(message, provider=provider, model=model)
+
+
+@functools.lru_cache(maxsize=8)
+def cached_client(factory: Callable[..., Any], api_key: str) -> Any:
+    """Build one SDK client per (factory, key) so its HTTP pool keeps connections alive across calls."""
+    return factory(api_key=api_key)
@@ -5,6 +5,17 @@ from dataclasses import asdict
 
 from soc_platform.models import HuntingPlaybook, IntelligencePackage
 
+# SPECTRA tool toggle -> DetectionQuery.platform emitted by the intelligence engine.
+HUNT_TOOL_PLATFORMS = {
+    "SentinelOne": "SentinelOne S1QL",
+    "Splunk": "Splunk SPL",
+    "Sentinel": "Microsoft Sentinel KQL",
+    "Palo Alto": "Palo Alto Query",
+    "Okta": "Okta Detection Query",
+    "DNS": "DNS Detection Logic",
+    "Proxy": "Proxy Search Logic",
+}
+
 
 def spectra_severity_model(package: IntelligencePackage) -> dict:
     """Weighted severity score 0-10 for SPECTRA lifecycle outputs."""
@@ -18,6 +18,17 @@ URL_RE = re.compile(r"https?://[^\s'\"<>]+")
 HASH_RE = re.compile(r"\b(?:[a-fA-F0-9]{32}|[a-fA-F0-9]{40}|[a-fA-F0-9]{64})\b")
 EMAIL_RE = re.compile(r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b")
 MITRE_RE = re.compile(r"\bT\d{4}(?:\.\d{3})?\b")
+REGISTRY_KEY_RE = re.compile(r"(?:HKLM|HKCU|HKEY_[A-Z_\\]+)\\[^\n\r,;]+")
+MUTEX_RE = re.compile(r"mutex[:=]\s*([\w\-.\\]+)", re.IGNORECASE)
+SERVICE_RE = re.compile(r"service[:=]\s*([\w\-.]+)", re.IGNORECASE)
+USER_AGENT_RE = re.compile(r"(?:User-Agent|UA)[:=]\s*([^\n\r]+)", re.IGNORECASE)
+FILE_PATH_RE = re.compile(r"[A-Za-z]:\\[^\n\r\"']+")
+NAMED_PIPE_RE = re.compile(r"\\\\\\.\\pipe\\[\w\-.]+")
+HIGH_IMPACT_RE = re.compile(r"ransomware|wiper|exfil|credential", re.IGNORECASE)
+ADVANCED_TTP_RE = re.compile(r"c2|command and control|lateral movement|persistence", re.IGNORECASE)
+ACTOR_RE = re.compile(r"(?:actor|group)[:=]\s*([^\n\r,;]+)", re.IGNORECASE)
+CAMPAIGN_RE = re.compile(r"campaign[:=]\s*([^\n\r,;]+)", re.IGNORECASE)
+FINANCIAL_MOTIVE_RE = re.compile(r"ransom|fraud|extort", re.IGNORECASE)
 
 
 def _uniq(items: list[str]) -> list[str]:
@@ -44,12 +55,12 @@ def _extract_iocs(text: str) -> IOCSet:
         except ValueError:
             continue
 
-    registry_keys = re.findall(r"(?:HKLM|HKCU|HKEY_[A-Z_\\]+)\\[^\n\r,;]+", text)
-    mutexes = re.findall(r"mutex[:=]\s*([\w\-.\\]+)", text, flags=re.IGNORECASE)
-    services = re.findall(r"service[:=]\s*([\w\-.]+)", text, flags=re.IGNORECASE)
-    user_agents = re.findall(r"(?:User-Agent|UA)[:=]\s*([^\n\r]+)", text, flags=re.IGNORECASE)
-    file_paths = re.findall(r"[A-Za-z]:\\[^\n\r\"']+", text)
-    named_pipes = re.findall(r"\\\\\\.\\pipe\\[\w\-.]+", text)
+    registry_keys = REGISTRY_KEY_RE.findall(text)
+    mutexes = MUTEX_RE.findall(text)
+    services = SERVICE_RE.findall(text)
+    user_agents = USER_AGENT_RE.findall(text)
+    file_paths = FILE_PATH_RE.findall(text)
+    named_pipes = NAMED_PIPE_RE.findall(text)
 
     return IOCSet(
         ips=_uniq(ips),
@@ -72,9 +83,9 @@ def _severity_score(iocs: IOCSet, text: str) -> float:
     score += min(len(iocs.domains), 10) * 0.25
     score += min(len(iocs.hashes), 10) * 0.4
     score += min(len(iocs.urls), 10) * 0.2
-    if re.search(r"ransomware|wiper|exfil|credential", text, flags=re.IGNORECASE):
+    if HIGH_IMPACT_RE.search(text):
         score += 1.8
-    if re.search(r"c2|command and control|lateral movement|persistence", text, flags=re.IGNORECASE):
+    if ADVANCED_TTP_RE.search(text):
         score += 1.2
     return round(min(score, 10.0), 2)
 
@@ -211,9 +222,9 @@ def build_intelligence_package(raw_input: str, input_kind: str) -> IntelligenceP
     severity = _severity_score(iocs, raw_input)
     confidence = _confidence_score(iocs, raw_input)
 
-    actor_match = re.search(r"(?:actor|group)[:=]\s*([^\n\r,;]+)", raw_input, re.IGNORECASE)
-    campaign_match = re.search(r"campaign[:=]\s*([^\n\r,;]+)", raw_input, re.IGNORECASE)
-    motivation = "financial" if re.search(r"ransom|fraud|extort", raw_input, re.I) else "espionage"
+    actor_match = ACTOR_RE.search(raw_input)
+    campaign_match = CAMPAIGN_RE.search(raw_input)
+    motivation = "financial" if FINANCIAL_MOTIVE_RE.search(raw_input) else "espionage"
 
     summary = ThreatSummary(
         title=f"{input_kind.title()} Intelligence Assessment",
@@ -33,6 +33,8 @@ TECHNIQUE_TO_TACTIC = {
 
 
 MITRE_RE = re.compile(r"\bT\d{4}(?:\.\d{3})?\b")
+# Validates one analyst-entered ID; use with fullmatch.
+TECHNIQUE_ID_RE = re.compile(r"T\d{4}(?:\.\d{3})?")
 
 
 def extract_techniques(text: str) -> list[str]:
@@ -49,9 +51,15 @@ def extract_techniques(text: str) -> list[str]:
 
 
 def build_coverage(techniques: list[str]) -> list[dict]:
+    by_tactic: dict[str, list[str]] = {}
+    for t in techniques:
+        tactic = TECHNIQUE_TO_TACTIC.get(t)
+        if tactic is not None:
+            by_tactic.setdefault(tactic, []).append(t)
+
     rows: list[dict] = []
     for tactic in TACTIC_ORDER:
-        mapped = [t for t in techniques if TECHNIQUE_TO_TACTIC.get(t) == tactic]
+        mapped = by_tactic.get(tactic, [])
         score = round(min(len(mapped) / 3, 1.0), 2)
         confidence = round(0.45 + (score * 0.5), 2) if mapped else 0.25
         rows.append(
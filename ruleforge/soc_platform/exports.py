@@ -4,12 +4,35 @@ import json
 from datetime import datetime, timezone
 
 
-def _timestamp() -> str:
+_REPORT_CSS = """\
+:root {
+  color-scheme: dark;
+  --bg:#0b0f14; --panel:#111722; --text:#edf2f7; --muted:#9aa6b2;
+  --line:#253244; --accent:#20c997; --warn:#f59f00; --critical:#e03131;
+}
+* { box-sizing:border-box; }
+body { margin:0; background:var(--bg); color:var(--text); font-family: "IBM Plex Sans", "Segoe UI", sans-serif; }
+.wrap { max-width:1040px; margin:0 auto; padding:32px; }
+.card { background:var(--panel); border:1px solid var(--line); border-radius:14px; padding:18px; margin-bottom:14px; }
+h1,h2,h3 { margin:0 0 10px; }
+pre { white-space:pre-wrap; background:#0e1520; border:1px solid var(--line); border-radius:10px; padding:12px; }
+.small { color:var(--muted); font-size:12px; }
+@media print {
+  @page { size: A4; margin: 0.5in; }
+  body { background:#000; color:#fff; }
+  .card { break-inside:avoid; }
+}
+"""
+
+
+def report_timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
 
-def build_professional_html_report(payload: dict, title: str) -> str:
+def build_professional_html_report(payload: dict, title: str, generated_at: str | None = None) -> str:
     """Dark-theme report suitable for browser print-to-PDF export."""
+    if generated_at is None:
+        generated_at = report_timestamp()
     return f"""
 <!DOCTYPE html>
 <html lang="en">
@@ -18,29 +41,12 @@ def build_professional_html_report(payload: dict, title: str) -> str:
 <meta name="viewport" content="width=device-width, initial-scale=1" />
 <title>{title}</title>
 <style>
-:root {{
-  color-scheme: dark;
-  --bg:#0b0f14; --panel:#111722; --text:#edf2f7; --muted:#9aa6b2;
-  --line:#253244; --accent:#20c997; --warn:#f59f00; --critical:#e03131;
-}}
-* {{ box-sizing:border-box; }}
-body {{ margin:0; background:var(--bg); color:var(--text); font-family: "IBM Plex Sans", "Segoe UI", sans-serif; }}
-.wrap {{ max-width:1040px; margin:0 auto; padding:32px; }}
-.card {{ background:var(--panel); border:1px solid var(--line); border-radius:14px; padding:18px; margin-bottom:14px; }}
-h1,h2,h3 {{ margin:0 0 10px; }}
-pre {{ white-space:pre-wrap; background:#0e1520; border:1px solid var(--line); border-radius:10px; padding:12px; }}
-.small {{ color:var(--muted); font-size:12px; }}
-@media print {{
-  @page {{ size: A4; margin: 0.5in; }}
-  body {{ background:#000; color:#fff; }}
-  .card {{ break-inside:avoid; }}
-}}
-</style>
+{_REPORT_CSS}</style>
 </head>
 <body>
 <div class="wrap">
   <h1>{title}</h1>
-  <div class="small">Generated {_timestamp()}</div>
+  <div class="small">Generated {generated_at}</div>
   <div class="card"><h2>Executive Summary</h2><pre>{json.dumps(payload.get('executive_summary', {}), indent=2)}</pre></div>
   <div class="card"><h2>Technical Analysis</h2><pre>{json.dumps(payload.get('technical_analysis', {}), indent=2)}</pre></div>
   <div class="card"><h2>IOC Tables</h2><pre>{json.dumps(payload.get('ioc_tables', {}), indent=2)}</pre></div>
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -48,15 +49,23 @@ class AccessPolicy:
     allow_deploy_generated_rules: bool
 
 
+# (allow_model_selection, allow_high_cost_models, allow_deploy_generated_rules)
+_ROLE_GRANTS: dict[str, tuple[bool, bool, bool]] = {
+    "admin": (True, True, True),
+    "soc_admin": (True, True, True),
+    "senior_analyst": (True, True, True),
+    "detection_engineer": (True, True, True),
+    "analyst": (True, False, False),
+    "hunter": (True, False, False),
+}
+_DEFAULT_GRANTS = (False, False, False)
+
+
+@functools.lru_cache(maxsize=32)
 def policy_for_role(role: str) -> AccessPolicy:
+    # Policies are frozen, so one normalised instance per role string can be shared.
     role_norm = (role or "analyst").strip().lower()
-    if role_norm in {"admin", "soc_admin"}:
-        return AccessPolicy(role_norm, True, True, True)
-    if role_norm in {"senior_analyst", "detection_engineer"}:
-        return AccessPolicy(role_norm, True, True, True)
-    if role_norm in {"analyst", "hunter"}:
-        return AccessPolicy(role_norm, True, False, False)
-    return AccessPolicy(role_norm, False, False, False)
+    return AccessPolicy(role_norm, *_ROLE_GRANTS.get(role_norm, _DEFAULT_GRANTS))
 
 
 def can_use_model(role: str, model_key: str) -> bool:
@@ -77,6 +86,8 @@ def audit_ai_request(
     allowed: bool,
     estimated_tokens: int,
 ) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
     payload = {
         "event": "ai_request",
         "principal": principal,
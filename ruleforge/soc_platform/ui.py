@@ -1,25 +1,16 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 import streamlit as st
 
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
 
-def inject_theme(theme: str = "dark") -> None:
-    is_dark = theme == "dark"
-
-    bg = "#070b11" if is_dark else "#f5f7fb"
-    panel = "#111827" if is_dark else "#ffffff"
-    panel_2 = "#0f172a" if is_dark else "#eef2f7"
-    text = "#e6edf3" if is_dark else "#0f172a"
-    muted = "#9aa4b2" if is_dark else "#475467"
-    line = "#233044" if is_dark else "#d0d5dd"
-    accent = "#20c997" if is_dark else "#0f766e"
-    danger = "#f85149" if is_dark else "#b42318"
-    warn = "#f59f00" if is_dark else "#b54708"
-    success = "#39d353" if is_dark else "#137333"
-    glow = "rgba(32,201,151,.35)" if is_dark else "rgba(15,118,110,.25)"
-
-    st.markdown(
-        f"""
+
+_THEME_CSS = """
 <style>
 @import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@400;500;600;700&family=Space+Grotesk:wght@500;600;700&family=IBM+Plex+Mono:wght@400;500&display=swap');
 :root {{
@@ -103,26 +94,56 @@ div[data-testid="stMetric"] label, div[data-testid="stMetric"] [data-testid="stM
 hr {{ border-color: var(--line); }}
 @keyframes slideIn {{ from {{ opacity:0; transform:translateY(6px); }} to {{ opacity:1; transform:translateY(0); }} }}
 </style>
-""",
-        unsafe_allow_html=True,
-    )
+"""
+
+
+def _minify_css(css: str) -> str:
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_RE.sub(r"\1", css).strip()
+
+
+_THEME_PALETTES = {
+    "dark": {
+        "bg": "#070b11", "panel": "#111827", "panel_2": "#0f172a", "text": "#e6edf3",
+        "muted": "#9aa4b2", "line": "#233044", "accent": "#20c997", "danger": "#f85149",
+        "warn": "#f59f00", "success": "#39d353", "glow": "rgba(32,201,151,.35)",
+    },
+    "light": {
+        "bg": "#f5f7fb", "panel": "#ffffff", "panel_2": "#eef2f7", "text": "#0f172a",
+        "muted": "#475467", "line": "#d0d5dd", "accent": "#0f766e", "danger": "#b42318",
+        "warn": "#b54708", "success": "#137333", "glow": "rgba(15,118,110,.25)",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _theme_css(theme: str) -> str:
+    palette = _THEME_PALETTES["dark" if theme == "dark" else "light"]
+    return _minify_css(_THEME_CSS.format_map(palette))
+
+
+def inject_theme(theme: str = "dark") -> None:
+    st.markdown(_theme_css(theme), unsafe_allow_html=True)
+
+
+_PAGE_ICONS = {
+    "Home / Intelligence Hub": "🏠",
+    "Threat Intelligence Engine": "🧠",
+    "Threat Hunting Engine v2.0 (SPECTRA)": "🎯",
+    "MITRE ATT&CK Coverage Engine": "🗺️",
+    "Playbook Builder": "📘",
+}
 
 
 def sidebar_nav(config_name: str, pages: list[str], active_page: str) -> str:
-    page_icons = {
-        "Home / Intelligence Hub": "🏠",
-        "Threat Intelligence Engine": "🧠",
-        "Threat Hunting Engine v2.0 (SPECTRA)": "🎯",
-        "MITRE ATT&CK Coverage Engine": "🗺️",
-        "Playbook Builder": "📘",
-    }
     with st.sidebar:
         st.markdown(f"### {config_name}")
         selected_page = st.radio(
             "Primary Navigation",
             pages,
             index=pages.index(active_page),
-            format_func=lambda p: f"{page_icons.get(p, '•')}  {p}",
+            format_func=lambda p: f"{_PAGE_ICONS.get(p, '•')}  {p}",
             label_visibility="collapsed",
         )
         st.markdown("---")
@@ -12,7 +12,7 @@ import pytest
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from detection_validator import DetectionEngine, DetectionResult
+from detection_validator import DetectionEngine, DetectionResult, _compile_rule_regex
 
 
 # ── Shared fixtures ───────────────────────────────────────────────────────────
@@ -165,6 +165,14 @@ class TestFieldRegex:
     def test_complex_capture_group_pattern(self, engine, proc_event):
         assert engine.field_regex(proc_event, "Image", r".*\\(rundll32|regsvr32|mshta)\.exe$")
 
+    def test_pattern_compiled_once_across_events(self, engine, proc_event):
+        pattern = r"mshtml,\s*RunHTMLApplication"
+        engine.field_regex(proc_event, "CommandLine", pattern)
+        hits_before = _compile_rule_regex.cache_info().hits
+        for _ in range(5):
+            assert engine.field_regex(proc_event, "CommandLine", pattern)
+        assert _compile_rule_regex.cache_info().hits == hits_before + 5
+
 
 # ── field_in ──────────────────────────────────────────────────────────────────
 
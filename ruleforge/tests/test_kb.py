@@ -13,6 +13,8 @@ import datetime
 import pytest
 from pathlib import Path
 
+from scripts.kb_split import load_combined
+
 KB_DIR = Path(__file__).parent.parent / "knowledge_bases"
 
 REQUIRED_KB_FILES = [
@@ -243,3 +245,26 @@ class TestKBPlatformCoverage:
         assert "user" in content or "saas" in content or "identity" in content or "access" in content, (
             "obsidian_security_detection_knowledge_base.json should contain SaaS/identity content"
         )
+
+
+# ── Combined KB Loading Tests ─────────────────────────────────────────────────
+
+class TestKBSplitLoading:
+    """kb_split must load the combined export, repairing it only when needed."""
+
+    def _write(self, tmp_path: Path, raw: bytes) -> Path:
+        path = tmp_path / "vendor_kb_combined.json"
+        path.write_bytes(raw)
+        return path
+
+    def test_valid_json_loads_unchanged(self, tmp_path: Path):
+        path = self._write(tmp_path, '{"desc": "the “admin” role"}'.encode("utf-8"))
+        assert load_combined(path) == {"desc": "the “admin” role"}
+
+    def test_invalid_utf8_is_replaced_before_repairs(self, tmp_path: Path):
+        raw = '{"desc": "the “admin” role '.encode("utf-8") + b'\xff"}'
+        assert load_combined(self._write(tmp_path, raw)) == {"desc": "the “admin” role \ufffd"}
+
+    def test_smart_quoted_json_is_repaired(self, tmp_path: Path):
+        path = self._write(tmp_path, "{“desc”: “admin”}".encode("utf-8"))
+        assert load_combined(path) == {"desc": "admin"}
@@ -7,6 +7,8 @@ These tests validate the full generate → evaluate → score pipeline
 using the built-in example rule, ensuring no regressions in the
 telemetry generation and detection engine pipeline.
 """
+import json
+import re
 import sys
 import pytest
 from pathlib import Path
@@ -21,6 +23,7 @@ from detection_validator import (
     ExampleRundll32Generator,
     ExampleRundll32Engine,
     ImprovedRundll32Engine,
+    _json_preview,
 )
 
 
@@ -107,6 +110,10 @@ class TestTelemetryGenerator:
         for e1, e2 in zip(events1, events2):
             assert set(e1.log_data.keys()) == set(e2.log_data.keys())
 
+    def test_utc_time_is_millisecond_iso8601(self, generator):
+        for event in generator.generate_true_positives(count=3):
+            assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z", event.log_data["UtcTime"])
+
     def test_event_ids_are_unique(self, generator):
         events = generator.generate_all(tp=10, tn=10, fp=5, evasion=5)
         ids = [e.event_id for e in events]
@@ -144,6 +151,17 @@ class TestSyntheticEventSerialization:
         assert restored.attack_technique == event.attack_technique
         assert restored.log_data == event.log_data
 
+    def test_import_events_round_trip_interns_field_names(self, tmp_path):
+        gen = ExampleRundll32Generator(seed=42)
+        events = gen.generate_true_positives(count=3)
+        path = tmp_path / "events.json"
+        gen.export_events(events, str(path))
+        restored = ExampleRundll32Generator.import_events(str(path))
+        assert [e.log_data for e in restored] == [e.log_data for e in events]
+        for event in restored:
+            for key in event.log_data:
+                assert key is sys.intern(key)
+
     def test_to_dict_contains_all_required_keys(self):
         event = SyntheticEvent(
             event_id="x",
@@ -308,6 +326,19 @@ class TestTestRunnerPipeline:
             f"CM total ({total}) must equal event count ({len(events)})"
         )
 
+    def test_metrics_cached_until_next_run(self, runner):
+        runner.run()
+        metrics = runner.get_metrics()
+        assert runner.get_metrics() is metrics
+        runner.run()
+        assert runner.get_metrics() is not metrics
+        assert runner.get_metrics()["confusion_matrix"] == metrics["confusion_matrix"]
+
+    def test_html_failure_preview_matches_truncated_dump(self):
+        log_data = {"CommandLine": "x" * 5000, "Nested": {str(i): i for i in range(500)}}
+        assert _json_preview(log_data, 600) == json.dumps(log_data, indent=2)[:600]
+        assert _json_preview({"a": 1}, 600) == json.dumps({"a": 1}, indent=2)
+
     def test_export_report_json_is_valid(self, runner):
         runner.run()
         report = runner.export_report_json()
@@ -1,3 +1,5 @@
+import json
+import logging
 import sys
 import types
 
@@ -5,7 +7,13 @@ import pytest
 
 from soc_platform.ai.providers.base import AIProviderError
 from soc_platform.ai.providers.factory import MODEL_REGISTRY, create_provider, model_choices
-from soc_platform.governance import RateLimiter, TokenMonitor, can_use_model, policy_for_role
+from soc_platform.governance import (
+    RateLimiter,
+    TokenMonitor,
+    audit_ai_request,
+    can_use_model,
+    policy_for_role,
+)
 
 
 class _DummyOpenAIUsage:
@@ -94,6 +102,12 @@ def test_provider_factory_registry_and_local_interface():
     assert result.estimated_tokens > 0
 
 
+def test_model_registry_is_read_only():
+    assert model_choices() == tuple(MODEL_REGISTRY)
+    with pytest.raises(TypeError):
+        MODEL_REGISTRY["rogue:model"] = MODEL_REGISTRY["local:deterministic"]
+
+
 def test_openai_adapter_with_mocked_sdk(monkeypatch):
     module = types.SimpleNamespace(OpenAI=lambda api_key: _DummyOpenAIClient())
     monkeypatch.setitem(sys.modules, "openai", module)
@@ -122,6 +136,24 @@ def test_anthropic_adapter_with_mocked_sdk(monkeypatch):
     assert result.request_id == "req-anthropic-1"
 
 
+def test_sdk_client_reused_across_calls(monkeypatch):
+    built = []
+
+    def _factory(api_key):
+        built.append(api_key)
+        return _DummyOpenAIClient()
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=_factory))
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-reuse")
+
+    provider = create_provider("openai:gpt-4o")
+    provider.generate_report("one")
+    provider.generate_playbook("two")
+    create_provider("openai:gpt-4o").generate_intelligence("three")
+
+    assert built == ["sk-reuse"]
+
+
 def test_google_adapter_with_mocked_sdk(monkeypatch):
     module = types.SimpleNamespace(
         configure=lambda api_key: None,
@@ -172,6 +204,25 @@ def test_rbac_model_and_role_controls():
     assert can_use_model("analyst", "google:gemini-1.5-pro") is True
 
 
+def test_policy_for_role_is_shared_per_role():
+    assert policy_for_role("Senior_Analyst ") is policy_for_role("Senior_Analyst ")
+    assert policy_for_role("Senior_Analyst ").role == "senior_analyst"
+    assert policy_for_role("") == policy_for_role("analyst")
+
+
+def test_audit_ai_request_logs_json_only_when_enabled(caplog):
+    with caplog.at_level(logging.WARNING, logger="ruleforge.governance"):
+        audit_ai_request("alice", "analyst", "intel", "local:deterministic", True, 10)
+    assert not caplog.records
+
+    with caplog.at_level(logging.INFO, logger="ruleforge.governance"):
+        audit_ai_request("alice", "analyst", "intel", "local:deterministic", True, 10)
+    payload = json.loads(caplog.records[-1].getMessage())
+    assert payload["event"] == "ai_request"
+    assert payload["principal"] == "alice"
+    assert payload["allowed"] is True
+
+
 def test_provider_interfaces_for_all_actions():
     provider = create_provider("local:deterministic")
     actions = [
@@ -33,3 +33,9 @@ def test_export_formatting_json_pdf_word():
     assert "<h1>Technical Guide</h1>" in word
     assert '"platform": "Splunk"' in det
     assert '"risk_score": 8.1' in obj_json
+
+
+def test_html_report_uses_supplied_generation_time():
+    html = build_professional_html_report(_sample_payload(), "Test Report", generated_at="2026-01-02 03:04 UTC")
+
+    assert "Generated 2026-01-02 03:04 UTC" in html
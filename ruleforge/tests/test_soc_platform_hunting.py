@@ -1,4 +1,5 @@
 from soc_platform.engines.hunting import (
+    HUNT_TOOL_PLATFORMS,
     build_spectra_report,
     export_spectra_json,
     export_spectra_txt,
@@ -47,3 +48,10 @@ def test_spectra_exports_json_and_txt_formatting():
     assert '"framework": "SPECTRA v2.0"' in json_out
     assert "Project SPECTRA Threat Hunting Report" in txt_out
     assert "Response Tier:" in txt_out
+
+
+def test_hunt_tool_platforms_match_generated_queries():
+    package = build_intelligence_package("T1071 8.8.8.8 bad.example", "Raw Threat Description")
+    platforms = {q.platform for q in package.detection_queries}
+
+    assert set(HUNT_TOOL_PLATFORMS.values()) <= platforms
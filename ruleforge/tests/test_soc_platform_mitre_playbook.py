@@ -1,4 +1,9 @@
-from soc_platform.engines.mitre import build_coverage, extract_techniques, weighted_coverage_score
+from soc_platform.engines.mitre import (
+    TECHNIQUE_ID_RE,
+    build_coverage,
+    extract_techniques,
+    weighted_coverage_score,
+)
 from soc_platform.engines.playbook import build_detection_playbook, to_json, to_markdown
 
 
@@ -17,6 +22,21 @@ def test_mitre_coverage_scoring_and_rows():
     assert all("tactic" in row and "coverage_score" in row for row in rows)
 
 
+def test_mitre_coverage_groups_techniques_by_tactic():
+    rows = {row["tactic"]: row for row in build_coverage(["T1071", "T9999", "T1059", "T1105"])}
+    assert rows["Command and Control"]["techniques"] == ["T1071", "T1105"]
+    assert rows["Execution"]["techniques"] == ["T1059"]
+    assert rows["Impact"]["techniques"] == []
+    assert rows["Impact"]["confidence_index"] == 0.25
+
+
+def test_technique_id_re_validates_single_ids():
+    assert TECHNIQUE_ID_RE.fullmatch("T1059.001")
+    assert TECHNIQUE_ID_RE.fullmatch("T1059")
+    assert not TECHNIQUE_ID_RE.fullmatch("T1059.1")
+    assert not TECHNIQUE_ID_RE.fullmatch("xT1059")
+
+
 def test_playbook_builder_and_exports():
     playbook = build_detection_playbook(
         scenario="Suspicious beaconing from finance endpoints",